@@ -20,9 +20,9 @@ class Task(dj.Lookup):
     task_description = '': varchar(255) # additional task details
     """
     
-    contents = [
-        ['pacman',               '1.0',     '1-dimensional force tracking']
-    ]
+    contents = (
+        ('pacman',               '1.0',     '1-dimensional force tracking'),
+    )
 
 # =======
 # LEVEL 1
@@ -36,21 +36,21 @@ class ElectrodeGeometry(dj.Lookup):
     electrode_tip_insulation_length = 0:  decimal(9,9) unsigned             # electrode tip insulation length, starting from tip bottom (m)
     """
 
-    contents = [
+    contents = (
         #id   |base shape |base-x   |base-y   |base-z    |base ins. |base rot. |tip prof. |tip-z   |tip ins.
-        [0,    'cuboid',   12e-6,    12e-6,    0,         0,         0,         'linear',  0,       0],        # flat square (e.g., Neuropixels)
-        [1,    'cylinder', 15e-6,    15e-6,    0,         0,         0,         'linear',  0,       0],        # flat circle (e.g., S-Probes)
-        [2,    'cylinder', 100e-6,   100e-6,   0,         0,         0,         'sharp',   1.5e-3,  0],        # cone (e.g., Utah array)
-        [3,    'cylinder', 100e-6,   100e-6,   139.5e-3,  129.5e-3,  0,         'sharp',   0.5e-3,  0.4e-3],   # sharp cylinder w/ insulation (e.g., FHC sharp electrode)
-        [4,    'cuboid',   50e-6,    50e-6,    123e-3,    0,         0,         'linear',  2e-3,    0],        # blunt cylinder w/ insulation (e.g., Natus hook-wire stock)
-        [5,    'cuboid',   50e-6,    50e-6,    120e-3,    0,         0,         'linear',  5e-3,    3e-3],     # blunt cylinder w/ insulation (e.g., Natus hook-wire stock)
-        [6,    'cuboid',   50e-6,    50e-6,    124e-3,    0,         0,         'linear',  1e-3,    0],        # blunt cylinder w/ insulation (Natus hook-wire QF 1,1)
-        [7,    'cuboid',   50e-6,    50e-6,    117e-3,    0,         0,         'linear',  8e-3,    7e-3],     # blunt cylinder w/ insulation (Natus hook-wire QF 1,2)
-        [8,    'cuboid',   50e-6,    50e-6,    121.75e-3, 0,         0,         'linear',  3.25e-3, 2.75e-3],  # blunt cylinder w/ insulation (Natus hook-wire QF 2,1)
-        [9,    'cuboid',   50e-6,    50e-6,    119.75e-3, 0,         0,         'linear',  5.25e-3, 4.75e-3],  # blunt cylinder w/ insulation (Natus hook-wire QF 2,2)
-        [10,   'cuboid',   50e-6,    50e-6,    123e-3,    0,         0,         'linear',  1e-3,    0],        # blunt cylinder w/ insulation (e.g., Natus hook-wire clipped)
-        [11,   'cuboid',   50e-6,    50e-6,    120e-3,    0,         0,         'linear',  4e-3,    3e-3]      # blunt cylinder w/ insulation (e.g., Natus hook-wire clipped)
-    ]
+        (0,    'cuboid',   12e-6,    12e-6,    0,         0,         0,         'linear',  0,       0),        # flat square (e.g., Neuropixels)
+        (1,    'cylinder', 15e-6,    15e-6,    0,         0,         0,         'linear',  0,       0),        # flat circle (e.g., S-Probes)
+        (2,    'cylinder', 100e-6,   100e-6,   0,         0,         0,         'sharp',   1.5e-3,  0),        # cone (e.g., Utah array)
+        (3,    'cylinder', 100e-6,   100e-6,   139.5e-3,  129.5e-3,  0,         'sharp',   0.5e-3,  0.4e-3),   # sharp cylinder w/ insulation (e.g., FHC sharp electrode)
+        (4,    'cuboid',   50e-6,    50e-6,    123e-3,    0,         0,         'linear',  2e-3,    0),        # blunt cylinder w/ insulation (e.g., Natus hook-wire stock)
+        (5,    'cuboid',   50e-6,    50e-6,    120e-3,    0,         0,         'linear',  5e-3,    3e-3),     # blunt cylinder w/ insulation (e.g., Natus hook-wire stock)
+        (6,    'cuboid',   50e-6,    50e-6,    124e-3,    0,         0,         'linear',  1e-3,    0),        # blunt cylinder w/ insulation (Natus hook-wire QF 1,1)
+        (7,    'cuboid',   50e-6,    50e-6,    117e-3,    0,         0,         'linear',  8e-3,    7e-3),     # blunt cylinder w/ insulation (Natus hook-wire QF 1,2)
+        (8,    'cuboid',   50e-6,    50e-6,    121.75e-3, 0,         0,         'linear',  3.25e-3, 2.75e-3),  # blunt cylinder w/ insulation (Natus hook-wire QF 2,1)
+        (9,    'cuboid',   50e-6,    50e-6,    119.75e-3, 0,         0,         'linear',  5.25e-3, 4.75e-3),  # blunt cylinder w/ insulation (Natus hook-wire QF 2,2)
+        (10,   'cuboid',   50e-6,    50e-6,    123e-3,    0,         0,         'linear',  1e-3,    0),        # blunt cylinder w/ insulation (e.g., Natus hook-wire clipped)
+        (11,   'cuboid',   50e-6,    50e-6,    120e-3,    0,         0,         'linear',  4e-3,    3e-3)      # blunt cylinder w/ insulation (e.g., Natus hook-wire clipped)
+    )
 
 
 @schema
@@ -59,17 +59,17 @@ class EquipmentCategory(dj.Lookup):
     equipment_category: varchar(32) # equipment category name
     """
 
-    contents = [
-        ['bioamplifier'],
-        ['chamber'],
-        ['graphics'],
-        ['load cell'],
-        ['motion tracker'],
-        ['neural signal processor'],
-        ['neural stimulator'],
-        ['spike sorter'],
-        ['task controller']
-    ]
+    contents = (
+        ('bioamplifier',),
+        ('chamber',),
+        ('graphics',),
+        ('load cell',),
+        ('motion tracker',),
+        ('neural signal processor',),
+        ('neural stimulator',),
+        ('spike sorter',),
+        ('task controller',)
+    )
 
 
 @schema
@@ -81,11 +81,11 @@ class EquipmentParameter(dj.Lookup):
     equipment_parameter_description = '': varchar(255) # equipment parameter description
     """
 
-    contents = [
-        ['force capacity', 'N', 'maximum force capacity'],
-        ['voltage output', 'V', 'calibrated output signal'],
-        ['diameter',       'm', 'equipment diameter']
-    ]
+    contents = (
+        ('force capacity', 'N', 'maximum force capacity'),
+        ('voltage output', 'V', 'calibrated output signal'),
+        ('diameter',       'm', 'equipment diameter')
+    )
 
 
 # =======
@@ -129,22 +129,25 @@ class ElectrodeArrayModel(dj.Lookup):
         -> ElectrodeGeometry
         """
 
-    contents = [
+    contents = (
         #model name    |model version |model manufacturer       |recording tissue |invasive
-        ['Hook-Wire',   'paired',      'Natus Medical Inc.',     'muscle',         True],
-        ['Hook-Wire',   'quad',        'custom',                 'muscle',         True],
-        ['Hook-Wire',   'clipped',     'custom',                 'muscle',         True],
-        ['Neuropixels', 'nhp demo',    'IMEC',                   'brain',          True],
-        ['S-Probe',     '32 chan',     'Plexon',                 'brain',          True],
-        ['V-Probe',     '24 chan',     'Plexon',                 'brain',          True],
-        ['Utah',        '96 chan',     'Blackrock Microsystems', 'brain',          True]
-    ]
+        ('Hook-Wire',   'paired',      'Natus Medical Inc.',     'muscle',         True),
+        ('Hook-Wire',   'quad',        'custom',                 'muscle',         True),
+        ('Hook-Wire',   'clipped',     'custom',                 'muscle',         True),
+        ('Neuropixels', 'nhp demo',    'IMEC',                   'brain',          True),
+        ('S-Probe',     '32 chan',     'Plexon',                 'brain',          True),
+        ('V-Probe',     '24 chan',     'Plexon',                 'brain',          True),
+        ('Utah',        '96 chan',     'Blackrock Microsystems', 'brain',          True)
+    )
 
     def build(self, verbose: bool=False):
 
         # build arrays without electrodes
         key_source = (self - self.Electrode).fetch('KEY')
 
+        # electrode geometry keys, cached by geometry attributes
+        elec_geom_cache = {}
+
         for array_key in key_source:
 
             if verbose:
@@ -310,6 +313,8 @@ class ElectrodeArrayModel(dj.Lookup):
                 shank_grid = np.array([])
 
             # build electrode array
+            shank_keys = []
+            elec_keys = []
             for shank_idx, (shank_coords, shank) \
                 in enumerate(zip(np.ndindex(shank_grid.shape), shank_grid.flatten())):
 
@@ -325,13 +330,16 @@ class ElectrodeArrayModel(dj.Lookup):
                     shank_tip_length = Decimal(shank['shank_tip_length']).quantize(Decimal('1e-9'))
                 )
 
-                self.Shank.insert1(shank_key)
+                shank_keys.append(shank_key)
                 
-                elec_geom_key = (ElectrodeGeometry & shank['electrode_geometry']).fetch1('KEY')
+                elec_geom_attr = tuple(sorted(shank['electrode_geometry'].items()))
+                if elec_geom_attr not in elec_geom_cache:
+                    elec_geom_cache[elec_geom_attr] = (ElectrodeGeometry & shank['electrode_geometry']).fetch1('KEY')
+
+                elec_geom_key = elec_geom_cache[elec_geom_attr]
 
                 if 'electrode_grid_coords' in shank.keys():
 
-                    elec_keys = []
                     for elec_idx, elec_coords in enumerate(shank['electrode_grid_coords']):
                         
                         elec_keys.append(dict(
@@ -348,7 +356,6 @@ class ElectrodeArrayModel(dj.Lookup):
                     electrode_grid_x_center = (shank['electrode_grid_spacing'][0] * (shank['electrode_grid_shape'][0] - 1))/2
                     electrode_grid_x_center = Decimal(electrode_grid_x_center).quantize(Decimal('1e-9'))
 
-                    elec_keys = []
                     for elec_idx, elec_coords in enumerate(np.ndindex(shank['electrode_grid_shape'])):
 
                         # electrode x-y coordinates
@@ -365,6 +372,9 @@ class ElectrodeArrayModel(dj.Lookup):
                             **elec_geom_key
                         ))
 
+            # insert shanks and electrodes in one transaction per array
+            with dj.conn().transaction:
+                self.Shank.insert(shank_keys)
                 self.Electrode.insert(elec_keys)
         
 
@@ -388,17 +398,17 @@ class Hardware(dj.Lookup):
         equipment_parameter_value: float
         """
 
-    contents = [
+    contents = (
         #hardware name   |equipment category        |hardware model                         |hardware manufacturer         |hardware manufacturer location  |hardware manual path
-        ['Speedgoat',     'task controller',         'Performance real-time target machine', 'Speedgoat GmbH',              'Liebefeld, Switzerland',        ''],
-        ['Cerebus',       'neural signal processor', 'LB 0028',                              'Blackrock Microsystems',      'Salt Lake City, UT',            '/srv/locker/churchland/General/equipment-manuals/CerebusNSP.pdf'],
-        ['CereStim',      'neural stimulator',       'LB 0314',                              'Blackrock Microsystems',      'Salt Lake City, UT',            '/srv/locker/churchland/General/equipment-manuals/CerestimR96.pdf'],
-        ['StimPulse',     'neural stimulator',       '55-60-0',                              'FHC, Inc',                    'Bowdoin, ME',                   '/srv/locker/churchland/General/equipment-manuals/StimPulse.pdf'],
-        ['Polaris',       'motion tracker',          'Spectra',                              'Northern Digital',            'Waterloo, Ontario, Canada',     '/srv/locker/churchland/General/equipment-manuals/Polaris.pdf'],
-        ['5lb Load Cell', 'load cell',               'LRM200',                               'FUTEK',                       'Irvine, CA',                    '/srv/locker/churchland/General/equipment-manuals/LRM200_5lb.pdf'],
-        ['DAM8',          'bioamplifier',            'ISO-DAM8A',                            'World Precision Instruments', 'Sarasota, FL',                  '/srv/locker/churchland/General/equipment-manuals/ISODAM8A.pdf'],
-        ['CILUX chamber', 'chamber',                 '6-IAM-J0',                             'Crist Instrument Co Inc',     'Hagerstown, MD',                '']
-    ]
+        ('Speedgoat',     'task controller',         'Performance real-time target machine', 'Speedgoat GmbH',              'Liebefeld, Switzerland',        ''),
+        ('Cerebus',       'neural signal processor', 'LB 0028',                              'Blackrock Microsystems',      'Salt Lake City, UT',            '/srv/locker/churchland/General/equipment-manuals/CerebusNSP.pdf'),
+        ('CereStim',      'neural stimulator',       'LB 0314',                              'Blackrock Microsystems',      'Salt Lake City, UT',            '/srv/locker/churchland/General/equipment-manuals/CerestimR96.pdf'),
+        ('StimPulse',     'neural stimulator',       '55-60-0',                              'FHC, Inc',                    'Bowdoin, ME',                   '/srv/locker/churchland/General/equipment-manuals/StimPulse.pdf'),
+        ('Polaris',       'motion tracker',          'Spectra',                              'Northern Digital',            'Waterloo, Ontario, Canada',     '/srv/locker/churchland/General/equipment-manuals/Polaris.pdf'),
+        ('5lb Load Cell', 'load cell',               'LRM200',                               'FUTEK',                       'Irvine, CA',                    '/srv/locker/churchland/General/equipment-manuals/LRM200_5lb.pdf'),
+        ('DAM8',          'bioamplifier',            'ISO-DAM8A',                            'World Precision Instruments', 'Sarasota, FL',                  '/srv/locker/churchland/General/equipment-manuals/ISODAM8A.pdf'),
+        ('CILUX chamber', 'chamber',                 '6-IAM-J0',                             'Crist Instrument Co Inc',     'Hagerstown, MD',                '')
+    )
 
 
 @schema
@@ -421,14 +431,14 @@ class Software(dj.Lookup):
         equipment_parameter_value: float
         """
 
-    contents = [
+    contents = (
         #software name  |software version |equipment category |software manufacturer |software manufacturer location |software manufacturer location  |software manual path
-        ['Simulink',     '',               'task controller',  'MathWorks',           'Natick, MA',                   ''],
-        ['Plexon OFS',   '4.5.0',          'spike sorter',     'Plexon',              'Dallas, TX',                   ''],
-        ['Kilosort',     '2.0',            'spike sorter',     'Cortexlab',           'UCL',                          ''],
-        ['Unity 3D',     '',               'graphics',         'Unity Technologies',  'San Francisco, CA',            ''],
-        ['Psychtoolbox', '3.0',            'graphics',         'open source',         '',                             '']
-    ]
+        ('Simulink',     '',               'task controller',  'MathWorks',           'Natick, MA',                   ''),
+        ('Plexon OFS',   '4.5.0',          'spike sorter',     'Plexon',              'Dallas, TX',                   ''),
+        ('Kilosort',     '2.0',            'spike sorter',     'Cortexlab',           'UCL',                          ''),
+        ('Unity 3D',     '',               'graphics',         'Unity Technologies',  'San Francisco, CA',            ''),
+        ('Psychtoolbox', '3.0',            'graphics',         'open source',         '',                             '')
+    )
 
 
 # =======
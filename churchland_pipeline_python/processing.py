@@ -410,52 +410,59 @@ class MotorUnit(dj.Imported):
                 fig.tight_layout(rect=[0, 0.03, 1, 0.95])
                 fig.suptitle('Session {}'.format(session_key['session_date']));
 
-    def make(self, key):
+    def _read_myosort(self, emg_sort_path: str) -> tuple:
+        """Reads spikes, labels, label groups, channels, and templates from Myosort files."""
 
-        # get path to sort files
-        emg_sort = EmgSort & key
-        emg_sort_path = emg_sort.fetch1('emg_sort_path')
+        if 'matlab_export' in emg_sort_path:
 
-        # ensure local path
-        emg_sort_path = reference.EngramTier.ensure_local(emg_sort_path)
+            # read data (and convert channels to 0-indexing)
+            spikes = sio.loadmat(os.path.join(emg_sort_path, 'spikes.mat'))['spikes'].flatten()
+            labels = sio.loadmat(os.path.join(emg_sort_path, 'labels.mat'))['labels'].flatten()
+            channels = sio.loadmat(os.path.join(emg_sort_path, 'channels.mat'))['channels'].flatten() - 1
+            templates = sio.loadmat(os.path.join(emg_sort_path, 'templates.mat'))['templates']
 
-        # load sort data
-        if emg_sort & {'software': 'Myosort'}:
+            # label group
+            label_group = np.unique(labels)
+
+        else:
+            # import last saved spike field
+            spikes = sio.loadmat(os.path.join(emg_sort_path, 'spikes.mat'))['Spk'][0][0][-1]
 
-            if 'matlab_export' in emg_sort_path:
+            # import labels and templates
+            labels = sio.loadmat(os.path.join(emg_sort_path, 'labels.mat'))['Lab'][0][0]
+            templates = sio.loadmat(os.path.join(emg_sort_path, 'templates.mat'))['W'][0][0]
 
-                # read data (and convert channels to 0-indexing)
-                spikes = sio.loadmat(emg_sort_path + 'spikes.mat')['spikes'].flatten()
-                labels = sio.loadmat(emg_sort_path + 'labels.mat')['labels'].flatten()
-                channels = sio.loadmat(emg_sort_path + 'channels.mat')['channels'].flatten() - 1
-                templates = sio.loadmat(emg_sort_path + 'templates.mat')['templates']
+            # infer import field based on last entry with non-zero templates
+            import_idx = next(i for i in reversed(range(len(templates))) if templates[i].shape[0] > 0)
+            import_field = templates.dtype.names[import_idx]
 
-                # label group
-                label_group = np.unique(labels)
+            labels = labels[next(i for i,name in enumerate(labels.dtype.names) if name==import_field)]
 
-            else:
-                # import last saved spike field
-                spikes = sio.loadmat(emg_sort_path + 'spikes.mat')['Spk'][0][0][-1]
+            # label groups
+            label_group = np.unique(labels)
+            label_group = label_group[np.nonzero(label_group)]
 
-                # import labels and templates
-                labels = sio.loadmat(emg_sort_path + 'labels.mat')['Lab'][0][0]
-                templates = sio.loadmat(emg_sort_path + 'templates.mat')['W'][0][0]
+            # templates and channels are not imported from this format
+            channels = None
+            templates = None
 
-                # infer import field based on last entry with non-zero templates
-                import_idx = next(i for i in reversed(range(len(templates))) if templates[i].shape[0] > 0)
-                import_field = templates.dtype.names[import_idx]
+        return spikes, labels, label_group, channels, templates
 
-                labels = labels[next(i for i,name in enumerate(labels.dtype.names) if name==import_field)]
-                templates = templates[import_idx]
+    def make(self, key):
 
-                # label groups
-                label_group = np.unique(labels)
-                label_group = label_group[np.nonzero(label_group)]
+        # get path to sort files
+        emg_sort = EmgSort & key
+        emg_sort_path, software = emg_sort.fetch1('emg_sort_path', 'software')
 
-                templates = None
+        # ensure local path
+        emg_sort_path = reference.EngramTier.ensure_local(emg_sort_path)
+
+        # load sort data
+        if software == 'Myosort':
+            spikes, labels, label_group, channels, templates = self._read_myosort(emg_sort_path)
 
         else:
-            print('Spike sorter {} unrecognized. Unspecified import method.'.format(emg_sort.fetch1('software')))
+            print('Spike sorter {} unrecognized. Unspecified import method.'.format(software))
             return None
 
         # construct motor unit keys
@@ -470,13 +477,18 @@ class MotorUnit(dj.Imported):
         # construct template keys
         if np.any(templates):
 
+            # fetch channel keys once, indexed by EMG channel index
+            channel_keys, emg_channel_idx = (acquisition.EmgChannelGroup.Channel & key).fetch('KEY', 'emg_channel_idx')
+            channel_keys = dict(zip(emg_channel_idx, channel_keys))
+            assert len(channel_keys) == len(emg_channel_idx), 'Duplicate EMG channel indices'
+
             template_keys = []
             for chan_idx, unit_idx in itertools.product(range(templates.shape[0]), range(templates.shape[2])):
 
                 template_keys.append({
                     **key, 
                     'motor_unit_id': unit_idx, 
-                    **(acquisition.EmgChannelGroup.Channel & key & {'emg_channel_idx': channels[chan_idx]}).fetch1('KEY'),
+                    **channel_keys[channels[chan_idx]],
                     'motor_unit_template': templates[chan_idx, :, unit_idx]
                 })
 
@@ -574,9 +586,9 @@ class Neuron(dj.Imported):
         # load sort data
         if brain_sort & {'software': 'Kilosort'}:
             
-            t_spike = np.load(brain_sort_path + 'spike_times.npy').astype(int)
-            cluster_id = np.load(brain_sort_path + 'spike_clusters.npy')
-            cluster_group = pd.read_csv(brain_sort_path + 'cluster_group.tsv', delimiter='\t')
+            t_spike = np.load(os.path.join(brain_sort_path, 'spike_times.npy')).astype(int)
+            cluster_id = np.load(os.path.join(brain_sort_path, 'spike_clusters.npy'))
+            cluster_group = pd.read_csv(os.path.join(brain_sort_path, 'cluster_group.tsv'), delimiter='\t')
 
             # rename cluster groups
             cluster_group['group'].replace({'good': 'single', 'mua': 'multi'}, inplace=True)
@@ -610,13 +622,17 @@ class Neuron(dj.Imported):
         fs = (acquisition.EphysRecording & key).fetch1('ephys_recording_sample_rate')
         half_wave_len = int(round((fs * WAVEFORM_DUR) / 2))
 
+        # bind reader methods used in the per-spike loops
+        get_analogsignal_chunk = reader.get_analogsignal_chunk
+        rescale_signal_raw_to_float = reader.rescale_signal_raw_to_float
+
         # construct template keys
         template_keys = []
         for neuron_key in neuron_keys:
 
             # read raw waveforms
             raw_waveforms = [
-                reader.get_analogsignal_chunk(
+                get_analogsignal_chunk(
                     block_index=0, 
                     seg_index=0, 
                     i_start=int(t_spk - half_wave_len),
@@ -629,7 +645,7 @@ class Neuron(dj.Imported):
 
             # rescale waveforms
             waveforms = np.array([
-                reader.rescale_signal_raw_to_float(raw_waveform, dtype='float64', channel_indexes=channel_indices)
+                rescale_signal_raw_to_float(raw_waveform, dtype='float64', channel_indexes=channel_indices)
                 for raw_waveform in raw_waveforms
             ])
 
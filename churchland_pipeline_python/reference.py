@@ -14,11 +14,11 @@ class EngramTier(dj.Lookup):
     engram_tier: varchar(32) # engram tier name
     """
 
-    contents = [
-        ['locker'],
-        ['labshare'],
-        ['staging']
-    ]
+    contents = (
+        ('locker',),
+        ('labshare',),
+        ('staging',)
+    )
 
     def get_remote_path(self):
         """Returns remote path (relative to U19 server) to a storage tier."""
@@ -63,15 +63,30 @@ class EngramTier(dj.Lookup):
 
         return os.path.sep.join(path_parts)
 
+    @classmethod
+    def get_tier_names(self) -> list:
+        """Returns storage tier names (cached on the class once the table is populated)."""
+
+        if getattr(self, '_engram_tier_names', None):
+            return self._engram_tier_names
+
+        tier_names = list(self.fetch('engram_tier'))
+
+        # only cache a populated table
+        if tier_names:
+            self._engram_tier_names = tier_names
+
+        return tier_names
+
     @classmethod
     def ensure_remote(self, path: str) -> str:
         """Ensures that a path to a storage tier is provided relative to the remote (U19) server."""
 
         # infer storage tier from file path
-        engram_tier = {'engram_tier': tier for tier in self.fetch('engram_tier') if tier in path}
+        engram_tier = self & {'engram_tier': tier for tier in self.get_tier_names() if tier in path}
 
         # convert local path parts to remote
-        path = path.replace((self & engram_tier).get_local_path(), (self & engram_tier).get_remote_path())
+        path = path.replace(engram_tier.get_local_path(), engram_tier.get_remote_path())
 
         return path
 
@@ -80,10 +95,10 @@ class EngramTier(dj.Lookup):
         """Ensures that a path to a storage tier is provided relative to the local filesystem."""
 
         # infer storage tier from file path
-        engram_tier = {'engram_tier': tier for tier in self.fetch('engram_tier') if tier in path}
+        engram_tier = self & {'engram_tier': tier for tier in self.get_tier_names() if tier in path}
 
         # convert remote path parts to local
-        path = path.replace((self & engram_tier).get_remote_path(), (self & engram_tier).get_local_path())
+        path = path.replace(engram_tier.get_remote_path(), engram_tier.get_local_path())
 
         return path
 
@@ -100,13 +115,13 @@ class BrainLandmark(dj.Lookup):
     brain_landmark:      varchar(255) # brain landmark name
     """
 
-    contents = [
-        ['LF',  'Longitudinal Fissure'],
-        ['CS',  'Central Sulcus'],
-        ['SPD', 'Superior Precentral Dimple'],
-        ['SAS', 'Superior Arcuate Sulcus'],
-        ['IAS', 'Inferior Arcuate Sulcus']
-    ]
+    contents = (
+        ('LF',  'Longitudinal Fissure'),
+        ('CS',  'Central Sulcus'),
+        ('SPD', 'Superior Precentral Dimple'),
+        ('SAS', 'Superior Arcuate Sulcus'),
+        ('IAS', 'Inferior Arcuate Sulcus')
+    )
 
 
 @schema
@@ -117,11 +132,11 @@ class BrainRegion(dj.Lookup):
     brain_region:      varchar(255) # brain region name
     """
 
-    contents = [
-        ['M1',  'primary motor cortex'],
-        ['PMd', 'dorsal premotor cortex'],
-        ['SMA', 'supplementary motor area']
-    ]
+    contents = (
+        ('M1',  'primary motor cortex'),
+        ('PMd', 'dorsal premotor cortex'),
+        ('SMA', 'supplementary motor area')
+    )
 
 
 @schema
@@ -133,19 +148,19 @@ class Muscle(dj.Lookup):
     muscle_head = '': varchar(255) # muscle head
     """
 
-    contents = [
-        ['LonBic', 'biceps',           'long'],
-        ['ShoBic', 'biceps',           'short'],
-        ['AntDel', 'deltoid',          'anterior'],
-        ['LatDel', 'deltoid',          'lateral'],
-        ['PosDel', 'deltoid',          'posterior'],
-        ['ClaPec', 'pectoralis major', 'clavicular'],
-        ['StePec', 'pectoralis major', 'sternal'],
-        ['SupTra', 'trapezius',        'superior'],
-        ['LatTri', 'triceps',          'lateral'],
-        ['LonTri', 'triceps',          'long'],
-        ['MedTri', 'triceps',          'medial']
-    ]
+    contents = (
+        ('LonBic', 'biceps',           'long'),
+        ('ShoBic', 'biceps',           'short'),
+        ('AntDel', 'deltoid',          'anterior'),
+        ('LatDel', 'deltoid',          'lateral'),
+        ('PosDel', 'deltoid',          'posterior'),
+        ('ClaPec', 'pectoralis major', 'clavicular'),
+        ('StePec', 'pectoralis major', 'sternal'),
+        ('SupTra', 'trapezius',        'superior'),
+        ('LatTri', 'triceps',          'lateral'),
+        ('LonTri', 'triceps',          'long'),
+        ('MedTri', 'triceps',          'medial')
+    )
 
     def proj_full_name(self):
         """Project full muscle name."""
@@ -36,13 +36,13 @@ def flatten_blobs(records: list, blob_names: list) -> list:
 
     for data in records:
         
-        # extract tuple containing each set of blob values per dict
-        key_value_set = [X for X in zip(*[data[key_name] for key_name in blob_names])]
-
-        for key_values in key_value_set:
+        # iterate over tuples containing each set of blob values per dict
+        for key_values in zip(*[data[key_name] for key_name in blob_names]):
 
             # flatten dictionaries over blob values
-            flat_records.append(dict(data, **{k:v for k,v in zip(blob_names, key_values)}))
+            flat_record = data.copy()
+            flat_record.update(zip(blob_names, key_values))
+            flat_records.append(flat_record)
 
     return flat_records
 
@@ -218,16 +218,17 @@ def insert_part(master: DataJointTable, part_name: str, **kwargs) -> None:
         # ensure keyword keys are members of secondary attributes list
         assert set(kwargs.keys()).issubset(set(part_table_attr.keys())), 'Unrecognized keyword argument(s)'
 
+        # existing entries
+        part_entity = part.fetch(as_dict=True)
+
         # check if entry already exists in table
-        if part():
+        if part_entity:
 
             # append default values if missing
             for key,val in part_table_attr.items():
                 if key not in kwargs.keys() and not math.isnan(val):
                     kwargs.update({key:val})
 
-            # existing entries
-            part_entity = part.fetch(as_dict=True)
             part_entity_attr = [{k:float(v) for k,v in entity.items() \
                 if k != master_attr_name and v is not None} \
                 for entity in part_entity]
@@ -279,8 +280,8 @@ def next_unique_int(table: DataJointTable, attr: str, key: dict={}) -> int:
     if not(table & key):
         min_val = 0
     else:
-        all_val = table.fetch(attr)
-        min_val = next(i for i in range(2+max(all_val)) if i not in all_val)
+        all_val = set(table.fetch(attr))
+        min_val = next(i for i in range(1+len(all_val)) if i not in all_val)
 
     return min_val
 
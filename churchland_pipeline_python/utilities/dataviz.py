@@ -127,9 +127,14 @@ def plot_table(
     # append table primary keys to set of key attributes
     key_attributes = set(key_attributes + table.primary_key) - set(list(filter(None, ignore)))
 
-    # split key and data attributes
-    data_keys = [{k: v for k, v in d.items() if k in key_attributes} for d in data_set]
-    data_set = [{k: v for k, v in d.items() if k in data_attributes} for d in data_set]
+    # split key and data attributes in a single pass (keys stored as hashable tuples for set membership tests)
+    data_keys = []
+    data_values = []
+    for d in data_set:
+        data_keys.append(tuple(sorted((k, v) for k, v in d.items() if k in key_attributes)))
+        data_values.append({k: v for k, v in d.items() if k in data_attributes})
+
+    data_set = data_values
 
     # plot data
     for layout_key in layout_keys:
@@ -157,7 +162,8 @@ def plot_table(
                 axs_keys = [dict(figure_key, **plot_key)]                
 
             # extract x and y data from datasets
-            data = [d for d, k in zip(data_set, data_keys) if k in axs_keys]
+            axs_key_set = {tuple(sorted(k.items())) for k in axs_keys}
+            data = [d for d, k in zip(data_set, data_keys) if k in axs_key_set]
 
             y_data = np.array([d[y] for d in data])
 
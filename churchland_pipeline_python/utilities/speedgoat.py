@@ -4,11 +4,29 @@ This package defines modules for parsing data from speedgoat
 
 import re
 import numpy as np
-from itertools import compress
+from collections import namedtuple
 
 num_clock_bytes = 8
 num_len_bytes = 2
 
+# task state read from .summary files
+SpeedgoatTaskState = namedtuple('SpeedgoatTaskState', ['task_state_id', 'task_state_name'])
+
+# precompiled patterns
+_TRIAL_RE = re.compile(r'beh_(\d*)')
+_TASK_STATE_RE = re.compile(r'TaskState(\d+)')
+_MATRIX_RE = re.compile(r'(-?)(\[)(.*)(\])')
+
+# Speedgoat data codes mapped to DataJoint trial attributes
+_DATA_CODES = {
+    'tst': 'task_state',
+    'for': 'force_raw_online',
+    'fof': 'force_filt_online',
+    'stm': 'stim',
+    'rew': 'reward',
+    'frm': 'photobox'
+}
+
 def read_task_states(file_path):
     """Reads task states from .summary files
 
@@ -16,7 +34,7 @@ def read_task_states(file_path):
         file_path ([type]): [description]
 
     Returns:
-        [type]: [description]
+        list: SpeedgoatTaskState named tuples (task_state_id, task_state_name)
     """
     
     # read summary text from file
@@ -24,18 +42,17 @@ def read_task_states(file_path):
     summaryText = fid.read()
     fid.close()
     
-    # convert summary text to dict
-    keys = re.findall(';(.*?):=',summaryText)
-    vals = re.findall(':=(.*?);',summaryText)
-    
     # convert summary text to dict
     summaryText = ';' + summaryText
     keys = re.findall(';(.*?):=',summaryText)
     vals = re.findall(':=(.*?);',summaryText)
     
-    # read set of task states as tuples
-    prog = re.compile('TaskState(\d+)')
-    taskStates = [(int(prog.search(k).group(1)), v[1:-1]) for k,v in zip(keys,vals) if prog.search(k) is not None]
+    # read set of task states as named tuples (single regex search per key)
+    taskStates = []
+    for k,v in zip(keys,vals):
+        match = _TASK_STATE_RE.search(k)
+        if match is not None:
+            taskStates.append(SpeedgoatTaskState(int(match.group(1)), v[1:-1]))
     
     return taskStates
     
@@ -52,7 +69,7 @@ def read_trial_params(file_path):
     assert file_path.endswith('.params'), 'Unrecognized Speedgoat parameters file'
 
     # read trial number
-    trial_num = re.search(r'beh_(\d*)',file_path).group(1)
+    trial_num = _TRIAL_RE.search(file_path).group(1)
 
     # read params from file
     with open(file_path,'r') as f:
@@ -63,15 +80,12 @@ def read_trial_params(file_path):
         return None
 
     # read parameter keys and values from string
-    paramStr = ';' + ''.join([chr(x) for x in data[num_clock_bytes:]])
+    paramStr = ';' + data[num_clock_bytes:].tobytes().decode('latin-1')
     keys = re.findall(';(.*?):=',paramStr)
     vals = re.findall(':=(.*?);',paramStr)
 
-    # matrix string pattern
-    matstr = re.compile(r'(-?)(\[)(.*)(\])')
-
-    # evaluate strings as numeric
-    vals = [eval(matstr.search(x).group(1) + matstr.search(x).group(3)) for x in vals]
+    # evaluate strings as numeric (single regex search per value)
+    vals = [eval(match.group(1) + match.group(3)) for match in map(_MATRIX_RE.search, vals)]
 
     # create parameter dictionary
     params = dict(zip(keys,vals))
@@ -96,7 +110,7 @@ def read_trial_data(file_path, success_state, sample_rate):
     assert file_path.endswith('.data'), 'Unrecognized Speedgoat data file'
 
     # read trial number
-    trial_num = re.search(r'beh_(\d*)',file_path).group(1)
+    trial_num = _TRIAL_RE.search(file_path).group(1)
     
     # read data from file
     with open(file_path,'r') as f:
@@ -110,12 +124,7 @@ def read_trial_data(file_path, success_state, sample_rate):
     SgTrial = {
         'successful_trial': [],
         'simulation_time': [],
-        'task_state': 'tst',
-        'force_raw_online': 'for',
-        'force_filt_online': 'fof',
-        'stim': 'stm',
-        'reward': 'rew',
-        'photobox': 'frm'
+        **{attr: code for code, attr in _DATA_CODES.items()}
     }
     
     idx = int(num_clock_bytes + num_len_bytes)
@@ -125,7 +134,8 @@ def read_trial_data(file_path, success_state, sample_rate):
     SgTrial['simulation_time'] = data[:num_clock_bytes,:].flatten('F').view(np.double)
 
     # check for dropped packets
-    if any([(x>int(0.5*sample_rate)) and x<int(1.5*sample_rate) for x in np.diff(SgTrial['simulation_time'])]):
+    time_step = np.diff(SgTrial['simulation_time'])
+    if np.any((time_step > int(0.5*sample_rate)) & (time_step < int(1.5*sample_rate))):
         print('Trial {} excluded due to dropped packets'.format(trial_num))
         return
 
@@ -133,7 +143,7 @@ def read_trial_data(file_path, success_state, sample_rate):
     while idx < nBytesPerTrial:
 
         # read data properties
-        dName = ''.join([chr(x) for x in data[idx+np.r_[:NUM_CODE_BYTES], 0]]).lower()
+        dName = data[idx:idx+NUM_CODE_BYTES, 0].tobytes().decode('latin-1').lower()
         dType = chr(data[NUM_CODE_BYTES+idx,0])
         dLen = int(data[1+NUM_CODE_BYTES+idx+np.r_[:2],0].view(np.uint16))
 
@@ -153,14 +163,12 @@ def read_trial_data(file_path, success_state, sample_rate):
             idx += 1
             continue
 
-        # Speedgoat to DataJoint dictionary key index
-        inDict = [x==dName if type(x)==str else False for x in SgTrial.values()]
-        if sum(inDict) == 1:
-
-            kIdx = list(compress(range(len(inDict)), inDict))[0]
+        # Speedgoat to DataJoint dictionary key
+        attr = _DATA_CODES.get(dName)
+        if attr is not None and isinstance(SgTrial[attr], str):
 
             # overwrite Speedgoat code with data values
-            SgTrial[list(SgTrial.keys())[kIdx]] = dVal
+            SgTrial[attr] = dVal
 
     # trial result
     lastState = SgTrial['task_state'][-1]